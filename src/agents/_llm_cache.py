@@ -0,0 +1,112 @@
+"""
+In-process response cache for deterministic LLM calls.
+
+AnalysisAgent prompts are fully determined by their inputs (search
+results, topic, depth), so repeated pipeline runs and dev/test loops
+often re-issue byte-identical prompts. Caching the parsed, validated
+response keyed by a hash of the prompt skips the LLM round trip, the
+JSON parse, and the schema validation entirely on a hit.
+
+The cache is deliberately small and dependency-free: an LRU dict with a
+TTL, behind a minimal backend protocol so an external backend (Redis,
+disk) could be swapped in later without touching the agent.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, Optional, Protocol
+
+
+def canonical_key(mode: str, label: str, depth: str, urls: Iterable[str]) -> str:
+    """
+    Build an order-insensitive cache key for an analysis request.
+
+    Two runs that differ only in search-result ordering or in duplicated
+    URLs produce the same key, so the second run can reuse the first
+    run's analysis even though the exact prompt bytes differ. The label
+    is lowercased and whitespace-normalized for the same reason.
+
+    Args:
+        mode: Analysis mode ("overview" or "compare")
+        label: Topic or "item_a vs item_b" label for the request
+        depth: Analysis depth ("short" or "detailed")
+        urls: Source URLs backing the analysis, in any order
+
+    Returns:
+        str: Hex digest usable as a cache key
+    """
+    parts = [mode, " ".join(label.lower().split()), depth]
+    parts.extend(sorted(set(urls)))
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Minimal interface an AnalysisAgent response cache must provide."""
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached value for key, or None if absent/expired."""
+        ...
+
+    def set(self, key: str, value: dict) -> None:
+        """Store value under key."""
+        ...
+
+
+class MemoryCache:
+    """
+    LRU cache with per-entry TTL, suitable as the default CacheBackend.
+
+    Entries expire ttl seconds after being stored; the least recently
+    used entry is evicted once maxsize is exceeded. Thread-safe: the
+    class-level agent caches are hit concurrently (compare-mode search
+    workers, batch analysis threads, every to_thread-ed pipeline
+    stage), and the expiry check-then-delete and insert-then-evict
+    sequences are not atomic on their own — two threads racing an
+    expiring key would raise KeyError. A lock held only for the dict
+    operations (no I/O, no hashing of large values) serializes them at
+    negligible cost.
+
+    Example:
+        >>> cache = MemoryCache(maxsize=128, ttl=3600)
+        >>> cache.set("key", {"summary": "..."})
+        >>> cache.get("key")
+        {'summary': '...'}
+    """
+
+    __slots__ = ("maxsize", "ttl", "_entries", "_lock")
+
+    def __init__(self, maxsize: int = 128, ttl: float = 3600.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before LRU eviction
+            ttl: Entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached value for key, or None if absent/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict) -> None:
+        """Store value under key, evicting the LRU entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -0,0 +1,67 @@
+"""
+Pydantic models for AnalysisAgent LLM responses.
+
+Each model mirrors one of the JSON shapes the analysis prompts ask
+Gemini to produce. model_validate_json parses and validates the raw
+response string in a single pass (pydantic v2 parses with jiter in
+compiled Rust), replacing the previous json.loads + manual key-walk
+two-step.
+"""
+
+from pydantic import BaseModel
+
+
+class OverviewResult(BaseModel):
+    """Overview-mode analysis of a single topic."""
+
+    summary: str
+    key_points: list[str]
+    pros: list[str]
+    cons: list[str]
+
+
+class ComparisonItem(BaseModel):
+    """Per-item half of a comparison."""
+
+    summary: str
+    strengths: list[str]
+    weaknesses: list[str]
+
+
+class Comparison(BaseModel):
+    """Side-by-side item analyses within a compare result."""
+
+    item_a: ComparisonItem
+    item_b: ComparisonItem
+
+
+class CompareResult(BaseModel):
+    """Full compare-mode analysis of two items."""
+
+    overview: str
+    comparison: Comparison
+    key_differences: list[str]
+    use_case_recommendations: list[str]
+
+
+class MergeResult(BaseModel):
+    """Cross-item fields produced by the compare-mode merge call."""
+
+    overview: str
+    key_differences: list[str]
+    use_case_recommendations: list[str]
+
+
+class BatchOverviewResult(BaseModel):
+    """Marshaled response for a multi-topic batch prompt."""
+
+    analyses: list[OverviewResult]
+
+
+# Response model per analysis mode, for dispatch in the retry helpers.
+SCHEMAS: dict[str, type[BaseModel]] = {
+    "overview": OverviewResult,
+    "compare": CompareResult,
+    "merge": MergeResult,
+    "batch": BatchOverviewResult,
+}
@@ -12,10 +12,233 @@ COMPLETELY REWRITTEN VERSION:
 - Eliminates hallucinations through structured prompts
 """
 
-import json
+import asyncio
+import hashlib
+import inspect
+import re
+from itertools import chain
+from string import Template
 from typing import Any, Optional
 
+from pydantic import ValidationError
+
+from src.agents._llm_cache import CacheBackend, MemoryCache, canonical_key
+from src.agents._schemas import SCHEMAS
 from src.agents.base import Agent, AgentResult
+from src.core.config import get_settings
+from src.core.rate_limit import AsyncRateLimiter
+
+
+def _make_overview_template(
+    detail_instruction: str,
+    summary_length: str,
+    points_count: str,
+    pros_cons_count: str,
+    depth: str,
+) -> Template:
+    """
+    Bake one depth variant of the overview prompt into a Template.
+
+    All static text (preamble, schema, checklist, depth literals) comes
+    first and the dynamic fields (topic, results) are appended last, so
+    providers with prefix KV-caching can reuse the computed prefix
+    across every overview call at the same depth.
+    """
+    return Template(f"""You are an expert AI research analyst. Your task is to analyze search results and produce a highly structured JSON output.
+
+CRITICAL INSTRUCTIONS:
+1. Respond ONLY with valid JSON. No markdown, no prose, no explanations.
+2. Do NOT include code blocks, comments, or trailing commas.
+3. Base your analysis STRICTLY on the provided search results - do not hallucinate information.
+4. Extract insights directly from the source material.
+5. {detail_instruction}
+
+OUTPUT SCHEMA (You must follow this EXACT structure):
+{{
+  "summary": "{summary_length} summarizing the topic based on the search results",
+  "key_points": [
+    "Key insight 1 from sources",
+    "Key insight 2 from sources",
+    "Key insight 3 from sources"
+    // {points_count} total
+  ],
+  "pros": [
+    "Advantage 1 backed by sources",
+    "Advantage 2 backed by sources"
+    // {pros_cons_count}
+  ],
+  "cons": [
+    "Limitation 1 backed by sources",
+    "Limitation 2 backed by sources"
+    // {pros_cons_count}
+  ]
+}}
+
+VALIDATION CHECKLIST:
+✓ Output is valid JSON (no trailing commas)
+✓ All fields are present: summary, key_points, pros, cons
+✓ key_points is an array of strings
+✓ pros is an array of strings
+✓ cons is an array of strings
+✓ All content is grounded in the provided search results
+✓ No markdown formatting or code blocks
+
+DEPTH: {depth}
+
+TOPIC: $topic
+
+SEARCH RESULTS (one source per line, fields separated by "|" in the order: number|title|url|snippet):
+$results_rows
+
+OUTPUT (JSON only):""")
+
+
+def _make_merge_template(
+    differences_count: str,
+    recommendations_count: str,
+) -> Template:
+    """
+    Bake one depth variant of the compare-merge prompt into a Template.
+
+    As with the overview template, the static preamble/schema/checklist
+    lead and the dynamic item names and analyses trail, keeping the
+    prefix byte-identical across merge calls for provider prompt
+    caching. The schema refers to the items generically ("Item A"); the
+    model substitutes the real names given in the dynamic section.
+    """
+    return Template(f"""You are an expert AI comparative research analyst. Two items have already been analyzed independently; your task is to merge those analyses into a comparison and produce a highly structured JSON output.
+
+CRITICAL INSTRUCTIONS:
+1. Respond ONLY with valid JSON. No markdown, no prose, no explanations.
+2. Do NOT include code blocks, comments, or trailing commas.
+3. Base your comparison STRICTLY on the provided summaries - do not hallucinate information.
+4. Provide objective, balanced comparison.
+5. Refer to the items by their given names in your output, not as "Item A"/"Item B".
+
+OUTPUT SCHEMA (You must follow this EXACT structure):
+{{
+  "overview": "2-3 paragraphs providing high-level comparison context between Item A and Item B",
+  "key_differences": [
+    "Major difference 1 between Item A and Item B",
+    "Major difference 2 between Item A and Item B"
+    // {differences_count} total
+  ],
+  "use_case_recommendations": [
+    "Use Item A when... (specific scenario)",
+    "Use Item B when... (specific scenario)"
+    // {recommendations_count} total
+  ]
+}}
+
+VALIDATION CHECKLIST:
+✓ Output is valid JSON (no trailing commas)
+✓ All fields are present: overview, key_differences, use_case_recommendations
+✓ All arrays contain strings
+✓ Comparison is objective and balanced
+✓ No markdown formatting or code blocks
+
+COMPARISON ITEMS:
+- Item A: $item_a
+- Item B: $item_b
+
+SUMMARY OF ITEM A:
+$summary_a
+
+SUMMARY OF ITEM B:
+$summary_b
+
+OUTPUT (JSON only):""")
+
+
+# Matches an optionally markdown-fenced JSON object, capturing the
+# object itself; applied once per LLM response in _parse_json_response.
+_JSON_RE = re.compile(r"^\s*(?:```(?:json)?\s*)?(\{.*\})\s*(?:```)?\s*$", re.S)
+
+# Strips leading "Introduction to"/"What is" and trailing question marks
+# from a result title in one pass when inferring a topic name.
+_TITLE_CLEAN = re.compile(r"^(?:Introduction to|What is)\s*|\?+$")
+
+_PLACEHOLDER_RE = re.compile(r"\$(\w+)")
+
+
+def _compile_segments(template: Template) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Split a prompt Template into static segments and ordered field names.
+
+    substitute() re-scans the full ~2 KB template with a regex on every
+    call; pre-splitting once at import reduces each prompt build to a
+    single str.join over the static segments interleaved with the
+    dynamic values.
+    """
+    text = template.template
+    segments: list[str] = []
+    fields: list[str] = []
+    last = 0
+    for match in _PLACEHOLDER_RE.finditer(text):
+        segments.append(text[last:match.start()])
+        fields.append(match.group(1))
+        last = match.end()
+    segments.append(text[last:])
+    return tuple(segments), tuple(fields)
+
+
+def _join_segments(
+    compiled: tuple[tuple[str, ...], tuple[str, ...]],
+    values: dict[str, str],
+) -> str:
+    """Interleave dynamic values into precompiled static segments."""
+    segments, fields = compiled
+    parts: list[str] = []
+    for segment, field in zip(segments, fields):
+        parts.append(segment)
+        parts.append(values[field])
+    parts.append(segments[-1])
+    return "".join(parts)
+
+
+# Prompt templates precompiled at import time, one per depth, with the
+# depth-specific literals already baked in and the remaining text split
+# into static segments around the dynamic fields. Building a prompt is
+# then a single join instead of re-running the depth branches and
+# re-interpolating ~2 KB of template text per call.
+_OVERVIEW_PROMPTS = {
+    "detailed": _compile_segments(_make_overview_template(
+        "Provide comprehensive, long-form analysis with extensive details.",
+        "3-4 detailed paragraphs", "5-7 key points", "3-4 items each", "detailed",
+    )),
+    "short": _compile_segments(_make_overview_template(
+        "Provide concise, focused analysis.",
+        "2-3 concise paragraphs", "3-4 key points", "2-3 items each", "short",
+    )),
+}
+
+_MERGE_PROMPTS = {
+    "detailed": _compile_segments(
+        _make_merge_template("5-7 key differences", "4-5 recommendations")),
+    "short": _compile_segments(
+        _make_merge_template("3-4 key differences", "2-3 recommendations")),
+}
+
+# Approximate input-token budget for the search results embedded in a
+# prompt, per depth (~4 chars per token). Bounding the dynamic section
+# keeps per-call latency and cost predictable even when the search agent
+# returns many long snippets; short mode gets a tight budget since its
+# output is a couple of paragraphs anyway.
+_TOKEN_BUDGETS = {"short": 1024, "detailed": 4096}
+
+# Compact schema reminders for correction retries. The retry only needs
+# the target shape and the broken output - resending the original prompt
+# (with its full results dump) roughly doubled the retry's token cost.
+_SCHEMA_HINTS = {
+    "overview": '{"summary": str, "key_points": [str], "pros": [str], "cons": [str]}',
+    "compare": (
+        '{"overview": str, "comparison": {"item_a": {"summary": str, '
+        '"strengths": [str], "weaknesses": [str]}, "item_b": {...same...}}, '
+        '"key_differences": [str], "use_case_recommendations": [str]}'
+    ),
+    "merge": '{"overview": str, "key_differences": [str], "use_case_recommendations": [str]}',
+    "batch": '{"analyses": [{"summary": str, "key_points": [str], "pros": [str], "cons": [str]}]}',
+}
 
 
 class AnalysisAgent(Agent):
@@ -53,14 +276,41 @@ class AnalysisAgent(Agent):
         >>> print(result.data["summary"])
     """
 
-    def __init__(self, llm_client: Any, max_retries: int = 1) -> None:
+    # Default caches are class-level: web handlers often construct an
+    # AnalysisAgent per request, and instance-level caches would start
+    # cold every time. All compiled artifacts (prompt segments, regexes,
+    # pydantic models, schema hints) already live at module scope for
+    # the same reason, so __init__ only binds per-instance state.
+    _shared_cache = MemoryCache(maxsize=128, ttl=3600.0)
+    _shared_request_cache = MemoryCache(maxsize=64, ttl=3600.0)
+
+    # One limiter for every Gemini call from every instance, created
+    # lazily so settings load on first construction rather than import.
+    # Keeps aggregate LLM traffic under the provider's QPM quota no
+    # matter how many analyses fan out concurrently.
+    _llm_limiter: Optional[AsyncRateLimiter] = None
+
+    def __init__(
+        self,
+        llm_client: Any,
+        max_retries: int = 1,
+        cache: Optional[CacheBackend] = None,
+        max_snippet_chars: int = 500,
+    ) -> None:
         """
         Initialize the AnalysisAgent with an LLM client.
 
         Args:
             llm_client: GeminiClient instance for making LLM API calls.
-                       Must have a generate(prompt: str) -> str method.
+                       Must have a generate(prompt: str) -> str method;
+                       an async generate_async is used when present,
+                       otherwise generate is offloaded to a thread.
             max_retries: Maximum retry attempts for JSON parsing (default: 1)
+            cache: Response cache backend keyed by prompt hash. Defaults
+                  to a small in-process MemoryCache; pass None-like custom
+                  backends (e.g. Redis-backed) to share across processes.
+            max_snippet_chars: Per-result snippet length cap applied when
+                  embedding search results in prompts (default: 500)
 
         Example:
             >>> from src.core.llm_client import GeminiClient
@@ -70,6 +320,44 @@ class AnalysisAgent(Agent):
         super().__init__("analysis")
         self.llm = llm_client
         self.max_retries = max_retries
+        self.max_snippet_chars = max_snippet_chars
+
+        # Parsed-response cache: identical prompts (repeat runs, retries,
+        # dev loops) skip the LLM call, JSON parse, and schema validation.
+        self.cache = cache if cache is not None else self._shared_cache
+        self.cache_stats = {"hits": 0, "misses": 0}
+
+        # Clients that accept response_schema (GeminiClient) get
+        # grammar-constrained decoding: the model emits schema-valid JSON
+        # by construction, so parse retries become a cold path. Detected
+        # once here rather than per call.
+        try:
+            self._llm_supports_schema = (
+                "response_schema" in inspect.signature(llm_client.generate).parameters
+            )
+        except (TypeError, ValueError):
+            self._llm_supports_schema = False
+
+        # Request-level cache keyed on the canonicalized (mode, label,
+        # depth, sorted source URLs). Unlike the prompt-hash cache above,
+        # it absorbs runs that differ only in result ordering or
+        # duplicated snippets, since those produce different prompt bytes
+        # but the same canonical key.
+        self._request_cache = self._shared_request_cache
+
+        # Shared QPM limiter (see class attribute); built on first
+        # construction from the configured budget
+        if AnalysisAgent._llm_limiter is None:
+            AnalysisAgent._llm_limiter = AsyncRateLimiter(
+                max_rate=get_settings().gemini_qpm, time_period=60.0
+            )
+
+        # Mode dispatch table: O(1) lookup in arun regardless of how many
+        # modes are added, and one place to register new analyzers
+        self._dispatch = {
+            "overview": self._analyze_overview,
+            "compare": self._analyze_compare,
+        }
 
     def run(
         self,
@@ -79,6 +367,7 @@ class AnalysisAgent(Agent):
         item_a: Optional[str] = None,
         item_b: Optional[str] = None,
         depth: str = "short",
+        include_sources: bool = True,
         **kwargs
     ) -> AgentResult:
         """
@@ -98,6 +387,9 @@ class AnalysisAgent(Agent):
             depth: Analysis depth ("short", "detailed")
                   - "short": Concise summaries and focused insights
                   - "detailed": Long-form comprehensive analysis
+            include_sources: Include the sources citation list in the
+                  output (default: True). Pass False when the caller
+                  discards it to skip extraction; "sources" is then [].
             **kwargs: Additional parameters for future use
 
         Returns:
@@ -145,29 +437,208 @@ class AnalysisAgent(Agent):
             ...     print(result.data["summary"])
             ...     print(result.data["sources"])
         """
-        if mode == "overview":
-            return self._analyze_overview(search_results, topic, depth)
-        elif mode == "compare":
-            return self._analyze_compare(search_results, item_a, item_b, depth)
-        else:
+        # Both modes are async internally (compare fans out to concurrent
+        # LLM calls); run the coroutine to completion for sync callers.
+        return asyncio.run(
+            self.arun(mode, search_results, topic=topic,
+                      item_a=item_a, item_b=item_b, depth=depth,
+                      include_sources=include_sources, **kwargs)
+        )
+
+    async def arun(
+        self,
+        mode: str,
+        search_results: dict,
+        topic: Optional[str] = None,
+        item_a: Optional[str] = None,
+        item_b: Optional[str] = None,
+        depth: str = "short",
+        include_sources: bool = True,
+        **kwargs
+    ) -> AgentResult:
+        """
+        Async counterpart of run() for callers already inside an event loop.
+
+        Accepts the same arguments and returns the same AgentResult
+        shapes; see run() for the full contract. Use this (optionally via
+        arun_many) to overlap several analyses instead of serializing
+        them.
+
+        Example:
+            >>> result = await analyzer.arun(
+            ...     mode="overview", search_results=search_data, topic="AI"
+            ... )
+        """
+        handler = self._dispatch.get(mode)
+        if handler is None:
             return AgentResult(
                 success=False,
                 error=f"Invalid mode '{mode}' for AnalysisAgent. Use 'overview' or 'compare'."
             )
+        return await handler(search_results, topic=topic, item_a=item_a,
+                             item_b=item_b, depth=depth,
+                             include_sources=include_sources)
 
-    def _analyze_overview(
+    async def arun_many(
+        self,
+        jobs: list[dict],
+        max_concurrency: int = 4,
+    ) -> list[AgentResult]:
+        """
+        Analyze several jobs concurrently with bounded fan-out.
+
+        Each job is a kwargs dict for arun() (mode, search_results, ...).
+        Calls overlap on network wait, so N jobs complete in roughly the
+        time of the slowest few rather than the sum; the semaphore keeps
+        the number of in-flight Gemini calls within API rate limits.
+
+        Args:
+            jobs: List of arun() keyword-argument dicts
+            max_concurrency: Maximum number of jobs in flight at once
+
+        Returns:
+            list[AgentResult]: Results in the same order as jobs
+
+        Example:
+            >>> results = await analyzer.arun_many([
+            ...     {"mode": "overview", "search_results": data_a, "topic": "A"},
+            ...     {"mode": "overview", "search_results": data_b, "topic": "B"},
+            ... ])
+        """
+        # Created per call so the semaphore binds to the running loop
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(job: dict) -> AgentResult:
+            async with semaphore:
+                return await self.arun(**job)
+
+        return list(await asyncio.gather(*(_bounded(job) for job in jobs)))
+
+    def run_batch(
+        self,
+        items: list[dict],
+        depth: str = "short",
+        marshal_size: int = 8,
+    ) -> list[AgentResult]:
+        """
+        Analyze many topics with marshaled prompts (overview mode).
+
+        Instead of one Gemini round trip per topic, up to marshal_size
+        topics are packed into a single prompt that returns a JSON array
+        of analyses, cutting per-request overhead and RPM pressure.
+        Chunks are dispatched concurrently; if a marshaled response fails
+        to parse or comes back with the wrong item count, that chunk
+        falls back to individual per-topic calls.
+
+        Args:
+            items: List of dicts with "search_results" (and optionally
+                  "topic"), mirroring the overview-mode run() kwargs
+            depth: Analysis depth applied to every item
+            marshal_size: Maximum topics per marshaled prompt; past
+                  ~8-16 the latency gain flattens while parse-failure
+                  blast radius grows
+
+        Returns:
+            list[AgentResult]: Per-item results in input order
+
+        Example:
+            >>> results = analyzer.run_batch([
+            ...     {"topic": "A", "search_results": data_a},
+            ...     {"topic": "B", "search_results": data_b},
+            ... ])
+        """
+        return asyncio.run(self.arun_batch(items, depth=depth, marshal_size=marshal_size))
+
+    async def arun_batch(
+        self,
+        items: list[dict],
+        depth: str = "short",
+        marshal_size: int = 8,
+    ) -> list[AgentResult]:
+        """Async counterpart of run_batch; see run_batch for the contract."""
+        chunks = [items[i:i + marshal_size] for i in range(0, len(items), marshal_size)]
+        parts = await asyncio.gather(
+            *(self._analyze_batch_chunk(chunk, depth) for chunk in chunks)
+        )
+        return [result for part in parts for result in part]
+
+    async def _analyze_batch_chunk(
+        self,
+        chunk: list[dict],
+        depth: str,
+    ) -> list[AgentResult]:
+        """
+        Analyze one marshaled chunk of overview items.
+
+        Items without search results fail individually without touching
+        the LLM; the rest share a single marshaled call, with a
+        per-item fallback if the marshaled response is unusable.
+
+        Args:
+            chunk: Slice of run_batch items (at most marshal_size)
+            depth: Analysis depth
+
+        Returns:
+            list[AgentResult]: Results aligned with the chunk order
+        """
+        out: list[Optional[AgentResult]] = [None] * len(chunk)
+        prepared: list[tuple[int, str, list]] = []
+
+        for idx, item in enumerate(chunk):
+            results = (item.get("search_results") or {}).get("results", [])
+            if not results:
+                out[idx] = AgentResult(
+                    success=False,
+                    error="No search results provided for overview analysis"
+                )
+                continue
+            results = self._dedupe_results(results)
+            topic = item.get("topic") or self._infer_topic_from_results(results)
+            prepared.append((idx, topic, results))
+
+        if prepared:
+            try:
+                prompt = self._build_batch_prompt(prepared, depth)
+                parsed = await self._acall_llm_with_retry(prompt, mode="batch")
+                analyses = parsed["analyses"]
+                if len(analyses) != len(prepared):
+                    raise ValueError(
+                        f"Expected {len(prepared)} analyses, got {len(analyses)}"
+                    )
+                for (idx, _, results), analysis in zip(prepared, analyses):
+                    analysis["sources"] = self._extract_sources(results)
+                    out[idx] = AgentResult(success=True, data=analysis)
+            except Exception:
+                # Marshaled response unusable; re-run the affected items
+                # individually so one bad array doesn't fail the batch
+                singles = await asyncio.gather(*(
+                    self._analyze_overview({"results": results}, topic, depth)
+                    for _, topic, results in prepared
+                ))
+                for (idx, _, _), result in zip(prepared, singles):
+                    out[idx] = result
+
+        return out
+
+    async def _analyze_overview(
         self,
         search_results: dict,
-        topic: Optional[str],
-        depth: str
+        topic: Optional[str] = None,
+        depth: str = "short",
+        include_sources: bool = True,
+        **_: Any
     ) -> AgentResult:
         """
         Perform overview analysis using Gemini LLM with strict JSON schema.
+        Extra kwargs from the shared dispatch signature (item_a/item_b)
+        are accepted and ignored.
 
         Args:
             search_results: Search results with "results" key
             topic: Topic name (inferred if None)
             depth: Analysis depth ("short" or "detailed")
+            include_sources: Build the sources citation list (skipped
+                            entirely when the caller discards it)
 
         Returns:
             AgentResult: Success result with analysis data or error
@@ -181,25 +652,58 @@ class AnalysisAgent(Agent):
                     error="No search results provided for overview analysis"
                 )
 
+            # Drop mirror/duplicate snippets before any prompt work
+            results = self._dedupe_results(results)
+
             # Infer topic if not provided
             if not topic:
                 topic = self._infer_topic_from_results(results)
 
-            # Extract sources for citation
-            sources = self._extract_sources(results)
+            # Extract sources for citation (unless the caller opted out)
+            sources = self._extract_sources(results) if include_sources else []
+
+            # Single-result short circuit: the lone snippet IS the
+            # summary, so asking Gemini to expand it adds latency and
+            # cost without new signal. Assemble the result directly.
+            if len(results) <= 1:
+                first = results[0]
+                title = first.get("title", "")
+                data = {
+                    "summary": (first.get("snippet") or first.get("content") or "").strip()
+                               or title,
+                    "key_points": [title] if title else [],
+                    "pros": [],
+                    "cons": [],
+                    "sources": sources,
+                }
+                return AgentResult(success=True, data=data)
+
+            # Request-level cache hit: same topic/depth over the same URL
+            # set (in any order) reuses the prior analysis wholesale
+            request_key = canonical_key("overview", topic, depth,
+                                        (r["url"] for r in results if r.get("url")))
+            cached = self._request_cache.get(request_key)
+            if cached is not None:
+                analysis_data = dict(cached)
+                analysis_data["sources"] = sources
+                return AgentResult(success=True, data=analysis_data)
 
             # Build structured prompt
-            prompt = self._build_overview_prompt(results, topic, depth, sources)
+            prompt = self._build_overview_prompt(results, topic, depth)
 
             # Call LLM with retry logic
-            analysis_data = self._call_llm_with_retry(prompt, mode="overview")
+            analysis_data = await self._acall_llm_with_retry(prompt, mode="overview")
+
+            # Cache before splicing sources so the current run's sources
+            # never leak into a later hit
+            self._request_cache.set(request_key, dict(analysis_data))
 
             # Add sources to output
             analysis_data["sources"] = sources
 
             return AgentResult(success=True, data=analysis_data)
 
-        except json.JSONDecodeError as e:
+        except ValidationError as e:
             return AgentResult(
                 success=False,
                 error=f"Failed to parse LLM JSON response after retries: {str(e)}"
@@ -210,21 +714,34 @@ class AnalysisAgent(Agent):
                 error=f"Overview analysis failed: {str(e)}"
             )
 
-    def _analyze_compare(
+    async def _analyze_compare(
         self,
         search_results: dict,
-        item_a: Optional[str],
-        item_b: Optional[str],
-        depth: str
+        item_a: Optional[str] = None,
+        item_b: Optional[str] = None,
+        depth: str = "short",
+        include_sources: bool = True,
+        **_: Any
     ) -> AgentResult:
         """
         Perform comparative analysis using Gemini LLM with strict JSON schema.
 
+        Instead of one mega-prompt covering both items (a single long
+        sequential generation), each item gets its own overview analysis and
+        the two calls run concurrently via asyncio.gather. A third,
+        lightweight merge call then produces the cross-item fields
+        (overview, key_differences, use_case_recommendations). Since LLM
+        calls are latency-bound, overlapping the two big ones roughly
+        halves wall-clock time. Extra kwargs from the shared dispatch
+        signature (topic) are accepted and ignored.
+
         Args:
             search_results: Search results with "item_a" and "item_b" keys
             item_a: First item name (inferred if None)
             item_b: Second item name (inferred if None)
             depth: Analysis depth ("short" or "detailed")
+            include_sources: Build the sources citation list (skipped
+                            entirely when the caller discards it)
 
         Returns:
             AgentResult: Success result with comparison data or error
@@ -239,31 +756,101 @@ class AnalysisAgent(Agent):
                     error="Incomplete search results for comparison analysis"
                 )
 
+            # Drop mirror/duplicate snippets per item before prompt work
+            results_a = self._dedupe_results(results_a)
+            results_b = self._dedupe_results(results_b)
+
             # Infer item names if not provided
             if not item_a:
                 item_a = self._infer_topic_from_results(results_a)
             if not item_b:
                 item_b = self._infer_topic_from_results(results_b)
 
-            # Extract sources for citation
-            sources_a = self._extract_sources(results_a)
-            sources_b = self._extract_sources(results_b)
-            all_sources = sources_a + sources_b
-
-            # Build structured comparison prompt
-            prompt = self._build_compare_prompt(
-                results_a, results_b, item_a, item_b, depth, all_sources
+            # Extract sources in a single pass over both result sets;
+            # _extract_sources dedups by URL, so sources shared between
+            # the items appear once in the combined list
+            if include_sources:
+                all_sources = self._extract_sources(list(chain(results_a, results_b)))
+            else:
+                all_sources = []
+
+            # With a single result on either side there is not enough
+            # material for a grounded comparison; emit a deterministic
+            # stub from the snippets instead of three LLM calls.
+            if len(results_a) <= 1 or len(results_b) <= 1:
+                def _stub(results: list) -> dict:
+                    first = results[0]
+                    summary = (first.get("snippet") or first.get("content") or "").strip()
+                    return {
+                        "summary": summary or first.get("title", ""),
+                        "strengths": [],
+                        "weaknesses": [],
+                    }
+
+                comparison_data = {
+                    "overview": (
+                        f"Comparison of {item_a} and {item_b} based on "
+                        "limited search coverage."
+                    ),
+                    "comparison": {
+                        "item_a": _stub(results_a),
+                        "item_b": _stub(results_b),
+                    },
+                    "key_differences": [],
+                    "use_case_recommendations": [],
+                    "sources": all_sources,
+                }
+                return AgentResult(success=True, data=comparison_data)
+
+            # Request-level cache hit: same items/depth over the same URL
+            # set (in any order) reuses the prior comparison wholesale
+            request_key = canonical_key("compare", f"{item_a} vs {item_b}", depth,
+                                        (r["url"] for r in chain(results_a, results_b)
+                                         if r.get("url")))
+            cached = self._request_cache.get(request_key)
+            if cached is not None:
+                comparison_data = dict(cached)
+                comparison_data["sources"] = all_sources
+                return AgentResult(success=True, data=comparison_data)
+
+            # Analyze both items concurrently as independent overviews
+            prompt_a = self._build_overview_prompt(results_a, item_a, depth)
+            prompt_b = self._build_overview_prompt(results_b, item_b, depth)
+            analysis_a, analysis_b = await asyncio.gather(
+                self._acall_llm_with_retry(prompt_a, mode="overview"),
+                self._acall_llm_with_retry(prompt_b, mode="overview"),
             )
 
-            # Call LLM with retry logic
-            comparison_data = self._call_llm_with_retry(prompt, mode="compare")
-
-            # Add sources to output
+            # Small merge call for the cross-item fields only
+            merge_prompt = self._build_merge_prompt(
+                item_a, item_b, analysis_a, analysis_b, depth
+            )
+            merged = await self._acall_llm_with_retry(merge_prompt, mode="merge")
+
+            # Assemble the compare schema from the per-item overviews
+            comparison_data = {
+                "overview": merged["overview"],
+                "comparison": {
+                    "item_a": {
+                        "summary": analysis_a["summary"],
+                        "strengths": analysis_a["pros"],
+                        "weaknesses": analysis_a["cons"],
+                    },
+                    "item_b": {
+                        "summary": analysis_b["summary"],
+                        "strengths": analysis_b["pros"],
+                        "weaknesses": analysis_b["cons"],
+                    },
+                },
+                "key_differences": merged["key_differences"],
+                "use_case_recommendations": merged["use_case_recommendations"],
+            }
+            self._request_cache.set(request_key, dict(comparison_data))
             comparison_data["sources"] = all_sources
 
             return AgentResult(success=True, data=comparison_data)
 
-        except json.JSONDecodeError as e:
+        except ValidationError as e:
             return AgentResult(
                 success=False,
                 error=f"Failed to parse LLM JSON response after retries: {str(e)}"
@@ -274,12 +861,107 @@ class AnalysisAgent(Agent):
                 error=f"Comparison analysis failed: {str(e)}"
             )
 
+    def _dedupe_results(self, results: list) -> list:
+        """
+        Drop duplicate search results before prompt construction.
+
+        Search engines frequently return the same page under mirror URLs;
+        feeding the duplicates to the LLM wastes input tokens and biases
+        the summary toward the repeated content. Results are keyed by a
+        digest of the lowercased title and snippet, first occurrence
+        wins, order is preserved.
+
+        Args:
+            results: List of raw search results
+
+        Returns:
+            list: Results with exact title+snippet duplicates removed
+        """
+        seen: set[bytes] = set()
+        out = []
+        for r in results:
+            key = hashlib.md5(
+                (
+                    (r.get("title") or "") + "|"
+                    + (r.get("snippet") or r.get("content") or "")
+                ).lower().encode()
+            ).digest()
+            if key not in seen:
+                seen.add(key)
+                out.append(r)
+        return out
+
+    def _compact_results(self, results: list, depth: str = "short") -> list[dict]:
+        """
+        Project search results down to the fields the analysis cites.
+
+        Full Tavily results carry raw_content, scores, etc. that only
+        inflate prompt tokens (and thus latency and cost) without
+        improving grounding; snippets are capped at max_snippet_chars.
+        On top of the per-snippet cap, a per-depth token budget
+        (estimated at ~4 chars/token) bounds the whole block: once the
+        budget is exhausted the current snippet is truncated with "..."
+        and the remaining results are dropped, keeping latency and cost
+        predictable for arbitrarily large result sets.
+
+        Args:
+            results: List of raw search results
+            depth: Analysis depth selecting the token budget
+
+        Returns:
+            list[dict]: title/url/snippet projections, prompt-ready
+        """
+        cap = self.max_snippet_chars
+        budget_chars = _TOKEN_BUDGETS.get(depth, _TOKEN_BUDGETS["short"]) * 4
+        used = 0
+        out: list[dict] = []
+        for r in results:
+            title = r.get("title", "")
+            url = r.get("url", "")
+            snippet = (r.get("snippet") or r.get("content") or "")[:cap]
+            remaining = budget_chars - used - len(title) - len(url)
+            if remaining <= 0:
+                break
+            if len(snippet) > remaining:
+                snippet = snippet[:remaining] + "..."
+            used += len(title) + len(url) + len(snippet)
+            out.append({"title": title, "url": url, "snippet": snippet})
+        return out
+
+    def _results_rows(self, results: list, depth: str = "short") -> str:
+        """
+        Serialize compacted results as numbered pipe-delimited rows.
+
+        JSON syntax (braces, quotes, repeated key names) is pure prompt
+        overhead — roughly 40% of the tokens in a serialized result list
+        carry no information the model needs. One "n|title|url|snippet"
+        row per source, with the schema described once in the prompt
+        preamble, conveys the same grounding in far fewer tokens. Pipe
+        characters inside field values are swapped for a broken bar so
+        the column structure stays unambiguous.
+
+        Args:
+            results: List of raw search results
+            depth: Analysis depth selecting the token budget
+
+        Returns:
+            str: Newline-joined pipe rows, prompt-ready
+        """
+        return "\n".join(
+            "|".join((
+                str(n),
+                r["title"].replace("|", "¦"),
+                r["url"],
+                r["snippet"].replace("|", "¦"),
+            ))
+            for n, r in enumerate(self._compact_results(results, depth), 1)
+        )
+
     def _build_overview_prompt(
         self,
         results: list,
         topic: str,
-        depth: str,
-        sources: list
+        depth: str
     ) -> str:
         """
         Build highly structured prompt for overview analysis.
@@ -288,322 +970,312 @@ class AnalysisAgent(Agent):
             results: List of search results
             topic: Topic name
             depth: Analysis depth
-            sources: List of source citations
 
         Returns:
             str: Structured prompt for Gemini
         """
-        # Format search results as JSON for source grounding
-        results_json = json.dumps(results, indent=2, ensure_ascii=False)
+        results_rows = self._results_rows(results, depth)
 
-        # Depth-specific instructions
-        if depth == "detailed":
-            detail_instruction = "Provide comprehensive, long-form analysis with extensive details."
-            summary_length = "3-4 detailed paragraphs"
-            points_count = "5-7 key points"
-            pros_cons_count = "3-4 items each"
-        else:  # short
-            detail_instruction = "Provide concise, focused analysis."
-            summary_length = "2-3 concise paragraphs"
-            points_count = "3-4 key points"
-            pros_cons_count = "2-3 items each"
+        # Join only the dynamic fields into the precompiled depth
+        # variant; unknown depths fall back to short as before
+        compiled = _OVERVIEW_PROMPTS.get(depth, _OVERVIEW_PROMPTS["short"])
+        return _join_segments(compiled, {"topic": topic, "results_rows": results_rows})
 
-        prompt = f"""You are an expert AI research analyst. Your task is to analyze search results and produce a highly structured JSON output.
-
-CRITICAL INSTRUCTIONS:
-1. Respond ONLY with valid JSON. No markdown, no prose, no explanations.
-2. Do NOT include code blocks, comments, or trailing commas.
-3. Base your analysis STRICTLY on the provided search results - do not hallucinate information.
-4. Extract insights directly from the source material.
-5. {detail_instruction}
-
-TOPIC: {topic}
-
-DEPTH: {depth}
-
-SEARCH RESULTS (Source-Grounded Data):
-{results_json}
-
-OUTPUT SCHEMA (You must follow this EXACT structure):
-{{
-  "summary": "{summary_length} summarizing {topic} based on the search results",
-  "key_points": [
-    "Key insight 1 from sources",
-    "Key insight 2 from sources",
-    "Key insight 3 from sources"
-    // {points_count} total
-  ],
-  "pros": [
-    "Advantage 1 backed by sources",
-    "Advantage 2 backed by sources"
-    // {pros_cons_count}
-  ],
-  "cons": [
-    "Limitation 1 backed by sources",
-    "Limitation 2 backed by sources"
-    // {pros_cons_count}
-  ]
-}}
-
-VALIDATION CHECKLIST:
-✓ Output is valid JSON (no trailing commas)
-✓ All fields are present: summary, key_points, pros, cons
-✓ key_points is an array of strings
-✓ pros is an array of strings
-✓ cons is an array of strings
-✓ All content is grounded in the provided search results
-✓ No markdown formatting or code blocks
-
-OUTPUT (JSON only):"""
-
-        return prompt
-
-    def _build_compare_prompt(
+    def _build_merge_prompt(
         self,
-        results_a: list,
-        results_b: list,
         item_a: str,
         item_b: str,
-        depth: str,
-        all_sources: list
+        analysis_a: dict,
+        analysis_b: dict,
+        depth: str
     ) -> str:
         """
-        Build highly structured prompt for comparative analysis.
+        Build the lightweight merge prompt for comparative analysis.
+
+        The heavy per-item work is already done by the two concurrent
+        overview calls; this prompt only asks for the cross-item fields.
+        Only the two summaries are embedded — the key_points/pros/cons
+        are spliced into the compare schema verbatim by the caller, so
+        resending them would roughly double the merge token cost for
+        fields the model never echoes back.
 
         Args:
-            results_a: Search results for item A
-            results_b: Search results for item B
             item_a: First item name
             item_b: Second item name
+            analysis_a: Parsed overview analysis for item A
+            analysis_b: Parsed overview analysis for item B
             depth: Analysis depth
-            all_sources: Combined source citations
 
         Returns:
-            str: Structured prompt for Gemini
+            str: Structured merge prompt for Gemini
         """
-        # Format search results as JSON for source grounding
-        results_a_json = json.dumps(results_a, indent=2, ensure_ascii=False)
-        results_b_json = json.dumps(results_b, indent=2, ensure_ascii=False)
-
-        # Depth-specific instructions
-        if depth == "detailed":
-            detail_instruction = "Provide comprehensive, detailed comparative analysis."
-            summary_length = "3-4 detailed paragraphs per item"
-            list_count = "4-5 items per list"
-            differences_count = "5-7 key differences"
-            recommendations_count = "4-5 recommendations"
-        else:  # short
-            detail_instruction = "Provide concise, focused comparative analysis."
-            summary_length = "2-3 concise paragraphs per item"
-            list_count = "2-3 items per list"
-            differences_count = "3-4 key differences"
-            recommendations_count = "2-3 recommendations"
-
-        prompt = f"""You are an expert AI comparative research analyst. Your task is to compare two items based on search results and produce a highly structured JSON output.
+        compiled = _MERGE_PROMPTS.get(depth, _MERGE_PROMPTS["short"])
+        return _join_segments(compiled, {
+            "item_a": item_a,
+            "item_b": item_b,
+            "summary_a": analysis_a["summary"],
+            "summary_b": analysis_b["summary"],
+        })
+
+    def _build_batch_prompt(
+        self,
+        prepared: list[tuple[int, str, list]],
+        depth: str
+    ) -> str:
+        """
+        Build one marshaled prompt covering several overview topics.
 
-CRITICAL INSTRUCTIONS:
-1. Respond ONLY with valid JSON. No markdown, no prose, no explanations.
-2. Do NOT include code blocks, comments, or trailing commas.
-3. Base your analysis STRICTLY on the provided search results - do not hallucinate information.
-4. Provide objective, balanced comparison grounded in sources.
-5. {detail_instruction}
+        Each topic contributes a numbered block of compacted search
+        results; the schema asks for one analyses array entry per block,
+        in order. Amortizes the fixed instruction overhead (and one
+        network round trip) across the whole chunk.
 
-COMPARISON ITEMS:
-- Item A: {item_a}
-- Item B: {item_b}
+        Args:
+            prepared: (index, topic, results) triples from the chunk
+            depth: Analysis depth
 
-DEPTH: {depth}
+        Returns:
+            str: Structured batch prompt for Gemini
+        """
+        blocks = []
+        for n, (_, topic, results) in enumerate(prepared, 1):
+            results_rows = self._results_rows(results, depth)
+            blocks.append(f"ITEM {n} TOPIC: {topic}\nITEM {n} SEARCH RESULTS (number|title|url|snippet per line):\n{results_rows}")
+        items_text = "\n\n".join(blocks)
 
-SEARCH RESULTS FOR {item_a}:
-{results_a_json}
+        return f"""You are an expert AI research analyst. Your task is to analyze search results for {len(prepared)} separate topics and produce a highly structured JSON output.
 
-SEARCH RESULTS FOR {item_b}:
-{results_b_json}
+CRITICAL INSTRUCTIONS:
+1. Respond ONLY with valid JSON. No markdown, no prose, no explanations.
+2. Do NOT include code blocks, comments, or trailing commas.
+3. Base each analysis STRICTLY on that item's search results - do not hallucinate information.
+4. Produce EXACTLY one analysis per item, in item order.
 
 OUTPUT SCHEMA (You must follow this EXACT structure):
 {{
-  "overview": "2-3 paragraphs providing high-level comparison context between {item_a} and {item_b}",
-  "comparison": {{
-    "item_a": {{
-      "summary": "{summary_length} describing {item_a}",
-      "strengths": [
-        "Strength 1 of {item_a} from sources",
-        "Strength 2 of {item_a} from sources"
-        // {list_count} total
-      ],
-      "weaknesses": [
-        "Weakness 1 of {item_a} from sources",
-        "Weakness 2 of {item_a} from sources"
-        // {list_count} total
-      ]
-    }},
-    "item_b": {{
-      "summary": "{summary_length} describing {item_b}",
-      "strengths": [
-        "Strength 1 of {item_b} from sources",
-        "Strength 2 of {item_b} from sources"
-        // {list_count} total
-      ],
-      "weaknesses": [
-        "Weakness 1 of {item_b} from sources",
-        "Weakness 2 of {item_b} from sources"
-        // {list_count} total
-      ]
+  "analyses": [
+    {{
+      "summary": "Paragraphs summarizing the item's topic based on its search results",
+      "key_points": ["Key insight 1", "Key insight 2", "Key insight 3"],
+      "pros": ["Advantage 1", "Advantage 2"],
+      "cons": ["Limitation 1", "Limitation 2"]
     }}
-  }},
-  "key_differences": [
-    "Major difference 1 between {item_a} and {item_b}",
-    "Major difference 2 between {item_a} and {item_b}"
-    // {differences_count} total
-  ],
-  "use_case_recommendations": [
-    "Use {item_a} when... (specific scenario)",
-    "Use {item_b} when... (specific scenario)"
-    // {recommendations_count} total
+    // one entry per item, {len(prepared)} total, in item order
   ]
 }}
 
 VALIDATION CHECKLIST:
 ✓ Output is valid JSON (no trailing commas)
-✓ All fields are present: overview, comparison, key_differences, use_case_recommendations
-✓ comparison.item_a and comparison.item_b each have: summary, strengths, weaknesses
-✓ All arrays contain strings
-✓ All content is grounded in the provided search results
-✓ Comparison is objective and balanced
+✓ analyses has exactly {len(prepared)} entries, in item order
+✓ Each entry has summary, key_points, pros, cons
+✓ All content is grounded in the matching item's search results
 ✓ No markdown formatting or code blocks
 
+DEPTH: {depth}
+
+{items_text}
+
 OUTPUT (JSON only):"""
 
-        return prompt
+    async def _agenerate(self, prompt: str, mode: str) -> str:
+        """
+        Generate a completion without blocking the event loop.
+
+        Clients exposing stream_generate_async are consumed chunk by
+        chunk and cut off as soon as the top-level JSON object closes
+        (see _aread_json_stream), so trailing chatter after the JSON is
+        never generated or billed. Otherwise the client's native async
+        API is used when available, and clients that only expose a
+        blocking generate() are offloaded to a worker thread via
+        asyncio.to_thread, so concurrent analyses still overlap on
+        network wait instead of stalling the loop. When the client
+        supports it, the mode's pydantic model is passed as a
+        response_schema for constrained JSON decoding.
 
-    def _call_llm_with_retry(self, prompt: str, mode: str) -> dict:
+        Args:
+            prompt: The text prompt to send to the LLM
+            mode: "overview", "compare", or "merge"
+
+        Returns:
+            str: Generated text response
+        """
+        kwargs = {}
+        if self._llm_supports_schema:
+            kwargs["response_schema"] = SCHEMAS.get(mode)
+        # All branches pass through the shared QPM limiter, so fan-out
+        # paths (arun_many, batch, compare's gather) stay under quota
+        async with self._llm_limiter:
+            stream_async = getattr(self.llm, "stream_generate_async", None)
+            if stream_async is not None:
+                return await self._aread_json_stream(stream_async(prompt, **kwargs))
+            generate_async = getattr(self.llm, "generate_async", None)
+            if generate_async is not None:
+                return await generate_async(prompt, **kwargs)
+            return await asyncio.to_thread(self.llm.generate, prompt, **kwargs)
+
+    @staticmethod
+    async def _aread_json_stream(stream) -> str:
+        """
+        Accumulate a streamed response, stopping at the end of the JSON.
+
+        Tracks brace depth (string- and escape-aware) across chunks;
+        once the first top-level object closes, the stream is closed and
+        anything after the closing brace is discarded. This both cuts
+        generation latency by however long the model would have kept
+        rambling and removes the trailing-prose parse failure mode. If
+        the stream ends without a complete object, the full buffer is
+        returned and the normal parse/retry path deals with it.
+
+        Args:
+            stream: Async iterator of text chunks
+
+        Returns:
+            str: The accumulated response, truncated at the object end
+        """
+        parts: list[str] = []
+        depth = 0
+        started = False
+        in_string = False
+        escaped = False
+        async for chunk in stream:
+            end = None
+            for i, ch in enumerate(chunk):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == "\\":
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    if started:
+                        in_string = True
+                elif ch == "{":
+                    depth += 1
+                    started = True
+                elif ch == "}" and started:
+                    depth -= 1
+                    if depth == 0:
+                        end = i
+                        break
+            if end is not None:
+                parts.append(chunk[:end + 1])
+                await stream.aclose()
+                break
+            parts.append(chunk)
+        return "".join(parts)
+
+    async def _acall_llm_with_retry(self, prompt: str, mode: str) -> dict:
         """
         Call LLM with retry logic for JSON parsing failures.
 
+        Runs async so that several analysis calls can overlap (e.g. both
+        items of a comparison); sync-only clients are offloaded via
+        _agenerate.
+
         Args:
             prompt: The structured prompt
-            mode: "overview" or "compare" (for error context)
+            mode: "overview", "compare", or "merge" (for error context)
 
         Returns:
             dict: Parsed JSON response
 
         Raises:
-            json.JSONDecodeError: If all retry attempts fail
+            ValidationError: If all retry attempts fail
         """
+        # Exact-match cache: prompts are deterministic functions of the
+        # inputs, so a hash hit means the full parse+validate result can
+        # be reused without touching the network.
+        cache_key = hashlib.sha256(prompt.encode()).hexdigest()
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.cache_stats["hits"] += 1
+            return dict(cached)
+        self.cache_stats["misses"] += 1
+
         last_error = None
 
         for attempt in range(self.max_retries + 1):
             try:
-                # Call Gemini LLM
-                response = self.llm.generate(prompt)
+                response = await self._agenerate(prompt, mode)
 
-                # Clean and parse response
-                parsed_json = self._parse_json_response(response)
-
-                # Validate schema
-                self._validate_response_schema(parsed_json, mode)
+                # Clean, parse, and validate in one pass
+                parsed_json = self._parse_json_response(response, mode)
 
+                self.cache.set(cache_key, dict(parsed_json))
                 return parsed_json
 
-            except json.JSONDecodeError as e:
+            except ValidationError as e:
                 last_error = e
                 if attempt < self.max_retries:
-                    # Retry with correction prompt
-                    correction_prompt = f"""The previous response was invalid JSON. Please fix and respond with ONLY valid JSON.
-
-Error: {str(e)}
-
-Previous response:
-{response}
-
-Requirements:
-1. Valid JSON only (no markdown, no comments)
-2. No trailing commas
-3. Follow the exact schema provided earlier
-
-OUTPUT (corrected JSON only):"""
-                    prompt = correction_prompt
+                    prompt = self._build_correction_prompt(e, response, mode)
                 else:
-                    # Final attempt failed
                     raise last_error
 
-        # Should not reach here, but just in case
         raise last_error
 
-    def _parse_json_response(self, response: str) -> dict:
+    def _build_correction_prompt(self, error: Exception, response: str, mode: str) -> str:
         """
-        Parse and clean JSON response from LLM.
+        Build the retry prompt asking the LLM to fix invalid JSON.
+
+        Deliberately minimal: a compact schema hint plus the (truncated)
+        broken response. Resending the original prompt with its full
+        results dump would roughly double the retry's token cost for no
+        extra signal.
 
         Args:
-            response: Raw LLM response
+            error: The JSON parsing error from the failed attempt
+            response: The invalid raw response
+            mode: "overview", "compare", or "merge"
 
         Returns:
-            dict: Parsed JSON
-
-        Raises:
-            json.JSONDecodeError: If parsing fails
+            str: Correction prompt for Gemini
         """
-        # Clean response
-        response = response.strip()
-
-        # Remove markdown code blocks if present
-        if response.startswith("```json"):
-            response = response[7:]
-        elif response.startswith("```"):
-            response = response[3:]
-
-        if response.endswith("```"):
-            response = response[:-3]
+        return f"""Return ONLY valid JSON (no markdown, no comments, no trailing commas) matching this schema:
+{_SCHEMA_HINTS[mode]}
 
-        response = response.strip()
+Error: {str(error)}
 
-        # Remove any leading/trailing text before/after JSON
-        # Find first { and last }
-        start_idx = response.find('{')
-        end_idx = response.rfind('}')
+Fix this:
+{response[:2000]}
 
-        if start_idx != -1 and end_idx != -1:
-            response = response[start_idx:end_idx + 1]
-
-        # Parse JSON
-        return json.loads(response)
+OUTPUT (corrected JSON only):"""
 
-    def _validate_response_schema(self, data: dict, mode: str) -> None:
+    def _parse_json_response(self, response: str, mode: str) -> dict:
         """
-        Validate that the response matches the expected schema.
+        Clean, parse, and validate a JSON response from LLM.
+
+        Markdown fences and stray prose around the JSON object are
+        stripped in a cheap string pre-pass; the remainder is then parsed
+        and schema-validated in a single pass by the pydantic model for
+        the mode, instead of json.loads followed by a separate key walk.
 
         Args:
-            data: Parsed JSON data
-            mode: "overview" or "compare"
+            response: Raw LLM response
+            mode: "overview", "compare", or "merge"
+
+        Returns:
+            dict: Parsed and validated JSON
 
         Raises:
-            ValueError: If schema validation fails
-        """
-        if mode == "overview":
-            required_fields = ["summary", "key_points", "pros", "cons"]
-            for field in required_fields:
-                if field not in data:
-                    raise ValueError(f"Missing required field: {field}")
-                if field != "summary" and not isinstance(data[field], list):
-                    raise ValueError(f"Field '{field}' must be a list")
-
-        elif mode == "compare":
-            required_fields = ["overview", "comparison", "key_differences", "use_case_recommendations"]
-            for field in required_fields:
-                if field not in data:
-                    raise ValueError(f"Missing required field: {field}")
-
-            # Validate comparison structure
-            if "item_a" not in data["comparison"] or "item_b" not in data["comparison"]:
-                raise ValueError("comparison must contain 'item_a' and 'item_b'")
-
-            for item in ["item_a", "item_b"]:
-                if "summary" not in data["comparison"][item]:
-                    raise ValueError(f"comparison.{item} must contain 'summary'")
-                if "strengths" not in data["comparison"][item]:
-                    raise ValueError(f"comparison.{item} must contain 'strengths'")
-                if "weaknesses" not in data["comparison"][item]:
-                    raise ValueError(f"comparison.{item} must contain 'weaknesses'")
+            ValidationError: If parsing or validation fails
+        """
+        # Extract the JSON object in one regex pass (optionally fenced
+        # response); the previous strip/startswith/endswith/find sequence
+        # rescanned a potentially large buffer several times. Responses
+        # with prose around the object fall back to the brace slice.
+        match = _JSON_RE.match(response)
+        if match:
+            response = match.group(1)
+        else:
+            start_idx = response.find('{')
+            end_idx = response.rfind('}')
+            if start_idx != -1 and end_idx != -1:
+                response = response[start_idx:end_idx + 1]
+
+        # Fused parse + validate: pydantic v2 decodes the JSON string and
+        # checks the schema in one compiled pass (jiter under the hood)
+        return SCHEMAS[mode].model_validate_json(response).model_dump()
 
     def _extract_sources(self, results: list) -> list:
         """
@@ -613,18 +1285,21 @@ OUTPUT (corrected JSON only):"""
             results: List of search results with title and url
 
         Returns:
-            list: List of source dicts with title and url
+            list: List of source dicts with title and url, deduplicated
+                 by URL in first-seen order
         """
-        sources = []
+        # Dict-based dedup: the same URL often appears across pages or
+        # items, and repeating it bloats both the prompt and the final
+        # sources payload. First occurrence wins.
+        seen: dict[str, dict] = {}
         for result in results:
-            title = result.get("title", "Untitled")
             url = result.get("url", "")
-            if url:  # Only include if URL exists
-                sources.append({
-                    "title": title,
+            if url and url not in seen:
+                seen[url] = {
+                    "title": result.get("title", "Untitled"),
                     "url": url
-                })
-        return sources
+                }
+        return list(seen.values())
 
     def _infer_topic_from_results(self, results: list) -> str:
         """
@@ -636,18 +1311,13 @@ OUTPUT (corrected JSON only):"""
         Returns:
             str: Inferred topic name
         """
-        if not results or len(results) == 0:
+        if not results:
             return "Unknown Topic"
 
-        first_result = results[0]
-        title = first_result.get("title", "Unknown Topic")
-
-        # Clean up title to extract topic
-        title = title.replace("Introduction to", "").strip()
-        title = title.replace("What is", "").strip()
-        title = title.replace("?", "").strip()
-
-        if ":" in title:
-            title = title.split(":")[0].strip()
+        # Clean up title to extract topic: one compiled-regex pass for
+        # the boilerplate prefixes/suffix instead of chained .replace
+        # scans, then slice at the first colon
+        title = _TITLE_CLEAN.sub("", results[0].get("title") or "")
+        title = title.split(":", 1)[0].strip()
 
         return title if title else "Unknown Topic"
@@ -13,13 +13,16 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentResult:
     """
     Standard result object returned by all agents.
 
     This dataclass provides a consistent interface for agent results,
     making it easy to handle success/failure cases and access result data.
+    Instances are slotted (no per-instance __dict__, which matters when
+    batched pipelines create one result per item) and frozen, so the
+    fields cannot be reassigned after construction.
 
     Attributes:
         success: Whether the agent operation completed successfully
@@ -56,6 +59,8 @@ class Agent(ABC):
         >>> result = agent.run(query="test")
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         """
         Initialize the agent with a name.
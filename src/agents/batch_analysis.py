@@ -0,0 +1,114 @@
+"""
+Deferred batch analysis jobs for non-interactive workloads.
+
+Overnight or bulk research runs do not need results synchronously; this
+module provides a submit/poll job interface over AnalysisAgent's
+marshaled batching so callers can fire off a large set of topics, go do
+other work, and collect the per-item results later. The job runs in a
+background thread (the work is network-bound, so the GIL is not a
+constraint) and benefits from the marshaled prompts and shared caches of
+run_batch.
+
+The Gemini SDK used here exposes no provider-side batch-file endpoint
+(the JSONL upload + half-price async completion flow of other
+providers), so the deferral is local: same interface shape, without the
+provider discount. If such an endpoint appears in the SDK, submit_batch
+is the single place to swap the transport.
+
+Example:
+    >>> from src.agents.batch_analysis import submit_batch, poll_batch
+    >>> job = submit_batch(analyzer, items, depth="short")
+    >>> # ... later ...
+    >>> results = poll_batch(job)
+    >>> if results is not None:
+    ...     print(results[0].data["summary"])
+"""
+
+import threading
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+from src.agents.analysis import AnalysisAgent
+from src.agents.base import AgentResult
+
+
+@dataclass
+class BatchAnalysisJob:
+    """
+    Handle for a deferred batch analysis run.
+
+    Attributes:
+        job_id: Unique identifier for the job
+        status: "running", "completed", or "failed"
+        results: Per-item AgentResults once completed, in input order
+        error: Failure description when status is "failed"
+    """
+
+    job_id: str
+    status: str = "running"
+    results: Optional[list[AgentResult]] = None
+    error: Optional[str] = None
+    _thread: Optional[threading.Thread] = field(default=None, repr=False)
+
+
+def submit_batch(
+    agent: AnalysisAgent,
+    items: list[dict],
+    depth: str = "short",
+    marshal_size: int = 8,
+) -> BatchAnalysisJob:
+    """
+    Start a batch of overview analyses in the background.
+
+    Returns immediately with a job handle; the analyses run on a worker
+    thread via AnalysisAgent.run_batch, so they get prompt marshaling
+    and the shared response caches for free.
+
+    Args:
+        agent: The AnalysisAgent to run the analyses with
+        items: run_batch items ("search_results" plus optional "topic")
+        depth: Analysis depth applied to every item
+        marshal_size: Maximum topics per marshaled prompt
+
+    Returns:
+        BatchAnalysisJob: Handle to pass to poll_batch
+    """
+    job = BatchAnalysisJob(job_id=uuid.uuid4().hex)
+
+    def _work() -> None:
+        try:
+            job.results = agent.run_batch(items, depth=depth,
+                                          marshal_size=marshal_size)
+            job.status = "completed"
+        except Exception as e:
+            job.error = f"Batch analysis failed: {str(e)}"
+            job.status = "failed"
+
+    thread = threading.Thread(target=_work, daemon=True)
+    job._thread = thread
+    thread.start()
+    return job
+
+
+def poll_batch(
+    job: BatchAnalysisJob,
+    timeout: Optional[float] = 0,
+) -> Optional[list[AgentResult]]:
+    """
+    Check a batch job, optionally waiting for it to finish.
+
+    Args:
+        job: Handle returned by submit_batch
+        timeout: Seconds to wait for completion. 0 (default) polls
+                without blocking; None blocks until the job finishes.
+
+    Returns:
+        list[AgentResult] when the job has completed, otherwise None
+        (still running, or failed — check job.status / job.error)
+    """
+    if job._thread is not None and job.status == "running":
+        job._thread.join(timeout=timeout)
+    if job.status == "completed":
+        return job.results
+    return None
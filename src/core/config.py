@@ -17,6 +17,33 @@ class Settings(BaseSettings):
     gemini_api_key: str | None = None
     tavily_api_key: str | None = None
 
+    # Outbound HTTP connection-pool sizing for the Tavily search
+    # session. pool_maxsize caps concurrent in-flight searches per
+    # host; raise it alongside the API worker pool when fanning out
+    # many pipelines, or concurrency silently serializes behind the
+    # connection pool.
+    http_pool_connections: int = 4
+    http_pool_maxsize: int = 8
+
+    # Sustained Gemini call budget in queries per minute. All analysis
+    # LLM calls share one limiter pinned to this rate, so batch and
+    # fan-out paths self-throttle below the provider quota instead of
+    # triggering 429 retry storms.
+    gemini_qpm: int = 500
+
+    # Origins allowed by the API's CORS middleware. The permissive
+    # default preserves existing behavior for local development; set an
+    # explicit list in production so browsers and CDNs can cache report
+    # responses keyed to real origins.
+    cors_origins: list[str] = ["*"]
+
+    # Ceiling on simultaneously executing research pipelines, and the
+    # per-pipeline wall-clock budget. Excess requests queue on the
+    # semaphore instead of fanning out into rate-limit errors or OOM;
+    # the timeout keeps a stuck pipeline from holding a slot forever.
+    max_concurrent_pipelines: int = 16
+    pipeline_timeout_seconds: float = 300.0
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
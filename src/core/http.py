@@ -0,0 +1,48 @@
+"""
+Shared HTTP session construction for outbound API calls.
+
+One place builds the pooled, retrying requests.Session the pipeline
+uses for outbound HTTP, so the Orchestrator can own a single session
+and hand it to every agent that talks to the network. Sharing the
+session means all agents in a process draw from one keep-alive
+connection pool: the TCP+TLS handshake to a given host is paid once,
+not once per agent instance.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.core.config import get_settings
+
+
+def build_session() -> requests.Session:
+    """
+    Build a requests.Session with pooled connections and retries.
+
+    Pool sizes come from Settings (http_pool_connections and
+    http_pool_maxsize), and transient 429/5xx responses retry with
+    exponential backoff at the transport layer. Session.post is
+    thread-safe, so one session can back concurrent worker threads.
+
+    Returns:
+        requests.Session: Configured session, ready to share
+
+    Example:
+        >>> session = build_session()
+        >>> session.post("https://api.example.com", data=b"{}")
+    """
+    settings = get_settings()
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=settings.http_pool_connections,
+        pool_maxsize=settings.http_pool_maxsize,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"],
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
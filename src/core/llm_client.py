@@ -5,7 +5,10 @@ This module provides a simple wrapper around the Google Gemini API
 for generating text completions in the research automation system.
 """
 
-import google.generativeai as genai
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 
 from src.core.config import get_settings
 
@@ -35,7 +38,15 @@ class GeminiClient:
         >>> response = client.generate("Write a research summary")
     """
 
-    def __init__(self, model_name: str = "gemini-2.5-flash") -> None:
+    __slots__ = ("model_name", "_model", "use_cache", "_cache", "_cache_maxsize",
+                 "max_retries", "_retryable")
+
+    def __init__(
+        self,
+        model_name: str = "gemini-2.5-flash",
+        use_cache: bool = True,
+        max_retries: int = 4,
+    ) -> None:
         """
         Initialize the Gemini client.
 
@@ -43,6 +54,10 @@ class GeminiClient:
         The API key is read from the LLM_API_KEY setting in your .env file.
 
         Args:
+            use_cache: Cache responses in-process keyed on (model, prompt)
+                      so identical prompts (retries, tests, repeat runs)
+                      skip the API round trip. Set False to always call
+                      the API (default: True).
             model_name: Name of the Gemini model to use.
                        Default is "gemini-pro".
                        Other options include:
@@ -62,6 +77,11 @@ class GeminiClient:
             >>> # or with custom model
             >>> client = GeminiClient(model_name="gemini-2.5-flash")
         """
+        # Imported here instead of at module top: the SDK's gRPC setup is
+        # heavy, and deferring it keeps process startup fast for code paths
+        # that never talk to the LLM.
+        import google.generativeai as genai
+
         # Load settings
         settings = get_settings()
 
@@ -69,10 +89,64 @@ class GeminiClient:
         # LLM_API_KEY in .env should contain your Gemini API key
         genai.configure(api_key=settings.llm_api_key)
 
-        # Store model name
+        # Store model name and build the model once; constructing a
+        # GenerativeModel per call re-reads configuration needlessly.
         self.model_name = model_name
+        self._model = genai.GenerativeModel(model_name)
+
+        # In-process LRU of prompt -> response text. A cache hit skips the
+        # network round trip entirely, which dwarfs every other cost here.
+        self.use_cache = use_cache
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_maxsize = 256
+
+        # Transient API failures worth retrying with exponential backoff;
+        # anything else (auth, bad request) propagates immediately.
+        from google.api_core import exceptions as api_exceptions
+
+        self.max_retries = max_retries
+        self._retryable = (
+            api_exceptions.ResourceExhausted,
+            api_exceptions.ServiceUnavailable,
+            api_exceptions.DeadlineExceeded,
+        )
+
+    def _cache_key(self, prompt: str, response_schema: type | None = None) -> str:
+        """Build the cache key for a prompt under the current model."""
+        tag = getattr(response_schema, "__name__", "")
+        return f"{self.model_name}:{tag}:{hashlib.sha256(prompt.encode()).hexdigest()}"
+
+    @staticmethod
+    def _generation_config(response_schema: type | None) -> dict | None:
+        """Build the constrained-decoding config for a response schema."""
+        if response_schema is None:
+            return None
+        # Grammar-constrained decoding: the model emits JSON matching the
+        # schema by construction, so no fence-stripping or parse retries
+        # are needed downstream.
+        return {
+            "response_mime_type": "application/json",
+            "response_schema": response_schema,
+        }
 
-    def generate(self, prompt: str) -> str:
+    def _cache_get(self, key: str) -> str | None:
+        """Return a cached response and refresh its LRU position."""
+        if not self.use_cache:
+            return None
+        text = self._cache.get(key)
+        if text is not None:
+            self._cache.move_to_end(key)
+        return text
+
+    def _cache_set(self, key: str, text: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        if not self.use_cache:
+            return
+        self._cache[key] = text
+        if len(self._cache) > self._cache_maxsize:
+            self._cache.popitem(last=False)
+
+    def generate(self, prompt: str, response_schema: type | None = None) -> str:
         """
         Generate text completion using Gemini model.
 
@@ -83,6 +157,8 @@ class GeminiClient:
         Args:
             prompt: The text prompt to send to the model.
                    Should be clear and specific for best results.
+            response_schema: Optional pydantic model (or schema type the
+                   SDK accepts) enabling grammar-constrained JSON output.
 
         Returns:
             str: Generated text response from the model
@@ -117,11 +193,140 @@ class GeminiClient:
             - For long prompts (>8K tokens), consider using gemini-1.5-pro
             - Temperature and other parameters use model defaults
         """
-        # Create model instance
-        model = genai.GenerativeModel(self.model_name)
+        key = self._cache_key(prompt, response_schema)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        config = self._generation_config(response_schema)
 
-        # Generate content from prompt
-        response = model.generate_content(prompt)
+        # Generate content from the shared model instance, retrying
+        # transient failures (rate limits, brief outages) with backoff
+        delay = 0.5
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self._model.generate_content(
+                    prompt, generation_config=config
+                )
+                break
+            except self._retryable:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, 20.0)
 
-        # Extract and return text from response
+        # Extract, cache, and return text from response
+        self._cache_set(key, response.text)
         return response.text
+
+    async def generate_async(self, prompt: str, response_schema: type | None = None) -> str:
+        """
+        Generate text completion asynchronously.
+
+        Non-blocking counterpart to generate(), suitable for overlapping
+        several independent LLM calls with asyncio.
+
+        Args:
+            prompt: The text prompt to send to the model
+            response_schema: Optional pydantic model (or schema type the
+                   SDK accepts) enabling grammar-constrained JSON output.
+
+        Returns:
+            str: Generated text response from the model
+
+        Example:
+            >>> client = GeminiClient()
+            >>> response = await client.generate_async("Summarize AI trends")
+        """
+        key = self._cache_key(prompt, response_schema)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        config = self._generation_config(response_schema)
+
+        delay = 0.5
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._model.generate_content_async(
+                    prompt, generation_config=config
+                )
+                break
+            except self._retryable:
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 20.0)
+
+        self._cache_set(key, response.text)
+        return response.text
+
+    async def stream_generate_async(self, prompt: str, response_schema: type | None = None):
+        """
+        Stream a completion as an async iterator of text chunks.
+
+        Lets callers start consuming (and stop) before the model finishes
+        generating — e.g. the analysis agent closes the stream as soon as
+        the top-level JSON object is complete, skipping any trailing
+        chatter the model would otherwise produce. Streamed responses
+        bypass the in-process response cache; callers that need caching
+        layer it over the assembled result.
+
+        Args:
+            prompt: The text prompt to send to the model
+            response_schema: Optional pydantic model (or schema type the
+                   SDK accepts) enabling grammar-constrained JSON output.
+
+        Yields:
+            str: Incremental text chunks in generation order
+
+        Example:
+            >>> client = GeminiClient()
+            >>> async for chunk in client.stream_generate_async("Summarize AI"):
+            ...     print(chunk, end="")
+        """
+        config = self._generation_config(response_schema)
+
+        # Retry only the initial request; once chunks are flowing a
+        # failure mid-stream propagates to the caller
+        delay = 0.5
+        for attempt in range(self.max_retries + 1):
+            try:
+                stream = await self._model.generate_content_async(
+                    prompt, generation_config=config, stream=True
+                )
+                break
+            except self._retryable:
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 20.0)
+
+        async for chunk in stream:
+            # Chunks without text parts (e.g. final usage metadata) raise
+            # ValueError on .text; skip them
+            try:
+                text = chunk.text
+            except ValueError:
+                continue
+            if text:
+                yield text
+
+    async def generate_batch(self, prompts: list[str]) -> list[str]:
+        """
+        Generate completions for several prompts concurrently.
+
+        The network round trips overlap instead of serializing, so N
+        prompts complete in roughly the time of the slowest one.
+
+        Args:
+            prompts: List of text prompts to send to the model
+
+        Returns:
+            list[str]: Generated responses, in the same order as prompts
+
+        Example:
+            >>> client = GeminiClient()
+            >>> responses = await client.generate_batch(["Prompt A", "Prompt B"])
+        """
+        return list(await asyncio.gather(*(self.generate_async(p) for p in prompts)))
@@ -7,15 +7,97 @@ for calling the appropriate agents in the correct sequence and
 passing data between them.
 """
 
+import asyncio
+import os
+import requests
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Optional
 
 from src.agents.planner import PlannerAgent
 from src.agents.web_search import WebSearchAgent
 from src.agents.analysis import AnalysisAgent
 from src.agents.report import ReportAgent
+from src.core.http import build_session
 from src.core.llm_client import GeminiClient
 
 
+@dataclass(slots=True, frozen=True)
+class PipelineResult:
+    """
+    Outcome of one research pipeline run.
+
+    A slotted frozen dataclass instead of the previous ad-hoc dicts:
+    one allocation per run, attribute access instead of string-key
+    hashing in batch loops, and immutability so cached results can't
+    be mutated by one caller under another. Exactly one of status or
+    error is set — status == "completed" on success, error + stage on
+    failure.
+
+    Attributes:
+        status: "completed" when the pipeline succeeded
+        mode: Research mode the pipeline ran in
+        topic: Main research topic (overview mode)
+        item_a: First comparison item (compare mode)
+        item_b: Second comparison item (compare mode)
+        depth: Analysis depth used
+        steps: Plan steps from the PlannerAgent
+        report_path: Path to the markdown report
+        view_url: URL to view the rendered report
+        report_html: Rendered HTML content, when generated
+        pdf_path: Path to the PDF report, when generated
+        pdf_url: URL to download the PDF, when generated
+        error: Failure description, on failure
+        stage: Failing stage (planning/search/analysis/report/pipeline)
+    """
+
+    status: Optional[str] = None
+    mode: Optional[str] = None
+    topic: Optional[str] = None
+    item_a: Optional[str] = None
+    item_b: Optional[str] = None
+    depth: Optional[str] = None
+    steps: Optional[list] = None
+    report_path: Optional[str] = None
+    view_url: Optional[str] = None
+    report_html: Optional[str] = None
+    pdf_path: Optional[str] = None
+    pdf_url: Optional[str] = None
+    error: Optional[str] = None
+    stage: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert to the pipeline's historical dict shape.
+
+        Error results keep the two-key {"error", "stage"} form; success
+        results carry the full metadata with the optional html/pdf keys
+        present only when those artifacts were generated, exactly as
+        the dict-returning implementation did. JSON-facing callers (the
+        API layer) serialize this form.
+        """
+        if self.error is not None:
+            return {"error": self.error, "stage": self.stage}
+
+        result = {
+            "status": self.status,
+            "mode": self.mode,
+            "topic": self.topic,
+            "item_a": self.item_a,
+            "item_b": self.item_b,
+            "depth": self.depth,
+            "steps": self.steps,
+            "report_path": self.report_path,
+            "view_url": self.view_url,
+        }
+        if self.report_html is not None:
+            result["report_html"] = self.report_html
+        if self.pdf_path is not None:
+            result["pdf_path"] = self.pdf_path
+            result["pdf_url"] = self.pdf_url
+        return result
+
+
 class Orchestrator:
     """
     Orchestrates the workflow between multiple agents.
@@ -39,28 +121,111 @@ class Orchestrator:
     Example:
         >>> orchestrator = Orchestrator()
         >>> result = orchestrator.run(mode="overview", topic="AI")
-        >>> if result["status"] == "completed":
-        ...     print(f"Report saved: {result['report_path']}")
+        >>> if result.status == "completed":
+        ...     print(f"Report saved: {result.report_path}")
     """
 
-    def __init__(self) -> None:
+    # Agents and the LLM client are built lazily on first access:
+    # constructing an Orchestrator is then effectively free, which
+    # matters for CLI/serverless invocations and keeps server startup
+    # paying only for what the first request actually touches. Each
+    # property caches its instance, so per-orchestrator there is still
+    # exactly one of everything.
+
+    @cached_property
+    def http_session(self) -> requests.Session:
+        """
+        Shared pooled HTTP session for every network-touching agent.
+
+        One keep-alive connection pool per orchestrator instead of one
+        per agent: the TCP+TLS handshake to each API host is paid once
+        for the process, and concurrent pipeline stages draw from the
+        same pool. (The Gemini SDK manages its own gRPC channel, so
+        only the REST-speaking agents take this session.)
+        """
+        return build_session()
+
+    @cached_property
+    def llm_client(self) -> GeminiClient:
+        """Shared Gemini client, created on first LLM-touching call."""
+        return GeminiClient()
+
+    @cached_property
+    def planner(self) -> PlannerAgent:
+        """PlannerAgent for generating structured research plans."""
+        return PlannerAgent()
+
+    @cached_property
+    def search_agent(self) -> WebSearchAgent:
+        """WebSearchAgent for Tavily searches, on the shared session."""
+        return WebSearchAgent(session=self.http_session)
+
+    @cached_property
+    def analysis_agent(self) -> AnalysisAgent:
+        """AnalysisAgent bound to the shared Gemini client."""
+        return AnalysisAgent(llm_client=self.llm_client)
+
+    @cached_property
+    def report_agent(self) -> ReportAgent:
+        """
+        ReportAgent in deferred-PDF mode: the pipeline returns as soon
+        as the markdown report exists; PDF rendering (~1s) finishes on
+        a background worker with the predicted pdf_path already in the
+        result.
+        """
+        return ReportAgent(async_pdf=True)
+
+    async def warmup(self) -> None:
+        """
+        Pre-pay the pipeline's cold-start costs before the first run.
+
+        Touches every lazy agent property (Gemini SDK configuration,
+        worker pools, the report template machinery), primes the
+        planner's plan cache, and opens a keep-alive connection to the
+        Tavily host so the first real search skips DNS + TCP + TLS
+        setup. Everything is best-effort: a warmup failure must never
+        block startup, so network errors are swallowed. Runs the
+        blocking work on a worker thread; call once at server startup.
+
+        Example:
+            >>> orc = Orchestrator()
+            >>> await orc.warmup()
+        """
+        def _prepare() -> None:
+            # Materialize the lazily-built agents and LLM client
+            self.llm_client
+            self.analysis_agent
+            self.report_agent
+
+            # Prime the plan cache (in-memory, effectively free)
+            self.planner.run(mode="overview")
+
+            # Open a pooled connection to the search host; the response
+            # is irrelevant — the TLS session it leaves behind is not
+            try:
+                self.http_session.head(self.search_agent.endpoint, timeout=5)
+            except requests.exceptions.RequestException:
+                pass
+
+        await asyncio.to_thread(_prepare)
+
+    def close(self) -> None:
         """
-        Initialize the orchestrator with all required agents.
+        Release the shared HTTP connection pool.
 
-        Creates instances of all agents in the pipeline:
-        - PlannerAgent: Generates structured research plans
-        - WebSearchAgent: Performs web searches (mock for now)
-        - AnalysisAgent: Analyzes search results using Gemini LLM
-        - ReportAgent: Generates final markdown reports
+        Only touches the session if a pipeline run actually built it —
+        closing a never-used Orchestrator stays free. Safe to call more
+        than once. Long-lived servers call this on shutdown; short-lived
+        callers can use the orchestrator as a context manager instead.
         """
-        # Initialize LLM client
-        self.llm_client = GeminiClient()
+        if "http_session" in self.__dict__:
+            self.http_session.close()
+
+    def __enter__(self) -> "Orchestrator":
+        return self
 
-        # Initialize agents
-        self.planner = PlannerAgent()
-        self.search_agent = WebSearchAgent()
-        self.analysis_agent = AnalysisAgent(llm_client=self.llm_client)
-        self.report_agent = ReportAgent()
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def run(
         self,
@@ -69,19 +234,18 @@ class Orchestrator:
         item_a: Optional[str] = None,
         item_b: Optional[str] = None,
         depth: str = "short"
-    ) -> dict[str, Any]:
+    ) -> PipelineResult:
         """
-        Execute the full multi-agent research pipeline.
-
-        Orchestrates all agents in sequence to complete a research task:
-        1. Planning: Generate research plan based on mode
-        2. Search: Gather information via web search
-        3. Analysis: Analyze and structure findings
-        4. Report: Generate formatted markdown report
+        Execute the full multi-agent research pipeline (sync facade).
 
-        Each step passes its output to the next step. If any step fails,
-        the pipeline stops immediately and returns an error with the
-        failure stage indicated.
+        A thin synchronous wrapper over arun() for CLI and script
+        callers: one event loop spins up for the duration of the
+        pipeline and the async implementation does all the work, so
+        the sync path gets the same stage overlap (planning+search
+        concurrent, compare-mode analyses gathered) for free and there
+        is exactly one pipeline implementation to maintain. Must not be
+        called from a thread with a running event loop — async callers
+        await arun() directly.
 
         Args:
             mode: Research mode ("overview" or "compare")
@@ -94,29 +258,10 @@ class Orchestrator:
                   Controls level of detail in analysis
 
         Returns:
-            dict: Pipeline result containing:
-
-                  On success:
-                  {
-                      "status": "completed",
-                      "mode": str,
-                      "topic": str | None,
-                      "item_a": str | None,
-                      "item_b": str | None,
-                      "depth": str,
-                      "steps": list,  # Plan steps from PlannerAgent
-                      "report_path": str,  # Path to markdown report
-                      "report_html": str,  # Rendered HTML content
-                      "pdf_path": str,  # Path to PDF report (if generated)
-                      "view_url": str,  # URL to view report
-                      "pdf_url": str  # URL to download PDF (if generated)
-                  }
-
-                  On failure:
-                  {
-                      "error": str,  # Error message
-                      "stage": str   # Which stage failed (planning/search/analysis/report)
-                  }
+            PipelineResult: status == "completed" with paths/URLs on
+                  success, or error + stage (planning/search/analysis/
+                  report) on failure. JSON-facing callers convert with
+                  to_dict(), which reproduces the historical dict shape.
 
         Example:
             >>> orchestrator = Orchestrator()
@@ -127,8 +272,8 @@ class Orchestrator:
             ...     topic="Machine Learning",
             ...     depth="medium"
             ... )
-            >>> print(result["status"])  # "completed"
-            >>> print(result["report_path"])  # "reports/20251203_123456_overview.md"
+            >>> print(result.status)  # "completed"
+            >>> print(result.report_path)  # "reports/20251203_123456_overview.md"
             >>>
             >>> # Comparative research
             >>> result = orchestrator.run(
@@ -137,37 +282,73 @@ class Orchestrator:
             ...     item_b="JavaScript",
             ...     depth="short"
             ... )
-            >>> print(result["steps"])  # Plan steps
-            >>> print(result["report_path"])  # Report location
+            >>> print(result.steps)  # Plan steps
+            >>> print(result.report_path)  # Report location
         """
-        # STEP 1: PLANNING
-        # Generate research plan based on mode
-        planner_result = self.planner.run(mode=mode)
-        if not planner_result.success:
-            return {
-                "error": planner_result.error,
-                "stage": "planning"
-            }
-        steps = planner_result.data["steps"]
-
-        # STEP 2: SEARCH
-        # Perform web search based on mode and parameters
-        search_result = self.search_agent.run(
+        return asyncio.run(self.arun(
             mode=mode,
             topic=topic,
             item_a=item_a,
-            item_b=item_b
+            item_b=item_b,
+            depth=depth
+        ))
+
+    async def arun(
+        self,
+        mode: str,
+        topic: Optional[str] = None,
+        item_a: Optional[str] = None,
+        item_b: Optional[str] = None,
+        depth: str = "short"
+    ) -> PipelineResult:
+        """
+        Execute the full multi-agent research pipeline (primary API).
+
+        This is the pipeline implementation; the sync run() is a thin
+        asyncio.run wrapper around it. The blocking stages
+        (planning, search, report) execute on worker threads so the
+        event loop stays free, and analysis goes through the analysis
+        agent's native async path — in compare mode that means the two
+        Tavily searches overlap on the search agent's worker pool and
+        the two per-item LLM analyses overlap via asyncio.gather, so
+        compare latency approaches max(item_a, item_b) rather than
+        their sum at both stages.
+
+        Example:
+            >>> result = await orchestrator.arun(
+            ...     mode="compare", item_a="Python", item_b="Go"
+            ... )
+        """
+        # STEPS 1+2: PLANNING and SEARCH run concurrently — the plan is
+        # derived from the mode alone and the search needs only the
+        # inputs, so neither depends on the other. Planning failures
+        # still take precedence in the error shape, matching run().
+        planner_result, search_result = await asyncio.gather(
+            asyncio.to_thread(self.planner.run, mode=mode),
+            asyncio.to_thread(
+                self.search_agent.run,
+                mode=mode,
+                topic=topic,
+                item_a=item_a,
+                item_b=item_b
+            )
         )
+        if not planner_result.success:
+            return PipelineResult(
+                error=planner_result.error,
+                stage="planning"
+            )
+        steps = planner_result.data["steps"]
+
         if not search_result.success:
-            return {
-                "error": search_result.error,
-                "stage": "search"
-            }
+            return PipelineResult(
+                error=search_result.error,
+                stage="search"
+            )
         search_results = search_result.data
 
-        # STEP 3: ANALYSIS
-        # Analyze search results to extract insights
-        analysis_result = self.analysis_agent.run(
+        # STEP 3: ANALYSIS (native async; compare gathers both items)
+        analysis_result = await self.analysis_agent.arun(
             mode=mode,
             search_results=search_results,
             topic=topic,
@@ -176,15 +357,15 @@ class Orchestrator:
             depth=depth
         )
         if not analysis_result.success:
-            return {
-                "error": analysis_result.error,
-                "stage": "analysis"
-            }
+            return PipelineResult(
+                error=analysis_result.error,
+                stage="analysis"
+            )
         analysis_output = analysis_result.data
 
         # STEP 4: REPORT
-        # Generate formatted markdown report
-        report_result = self.report_agent.run(
+        report_result = await asyncio.to_thread(
+            self.report_agent.run,
             mode=mode,
             analysis_output=analysis_output,
             topic=topic,
@@ -192,43 +373,114 @@ class Orchestrator:
             item_b=item_b
         )
         if not report_result.success:
-            return {
-                "error": report_result.error,
-                "stage": "report"
-            }
-        report_path = report_result.data["report_path"]
+            return PipelineResult(
+                error=report_result.error,
+                stage="report"
+            )
 
         # STEP 5: RETURN FINAL RESPONSE
-        # Return comprehensive result with all metadata
-        result = {
-            "status": "completed",
-            "mode": mode,
-            "topic": topic,
-            "item_a": item_a,
-            "item_b": item_b,
-            "depth": depth,
-            "steps": steps,
-            "report_path": report_path
-        }
+        return self._assemble_result(
+            mode=mode,
+            topic=topic,
+            item_a=item_a,
+            item_b=item_b,
+            depth=depth,
+            steps=steps,
+            report_data=report_result.data
+        )
 
-        # Extract filename from report path for URLs
-        import os
-        report_filename = os.path.basename(report_path)
+    async def run_many(
+        self,
+        jobs: list[dict],
+        max_concurrency: int = 8
+    ) -> list[PipelineResult]:
+        """
+        Run several research pipelines concurrently.
 
-        # Add markdown view URL
-        result["view_url"] = f"http://localhost:8000/reports/view/{report_filename}"
+        Each job dict holds arun() keyword arguments (mode plus
+        topic/item_a/item_b/depth). Jobs overlap on their network-bound
+        stages up to max_concurrency at a time, so N jobs complete in
+        roughly the time of the slowest ceil(N / max_concurrency) waves
+        instead of the sum of all N. A job that raises returns an error
+        result in its slot rather than failing the batch; results are
+        in input order.
 
-        # Add HTML content if it was generated
-        if "report_html" in report_result.data:
-            result["report_html"] = report_result.data["report_html"]
+        Args:
+            jobs: List of arun() keyword-argument dicts
+            max_concurrency: Maximum pipelines in flight at once
 
-        # Add PDF path and URL if it was generated
-        if "pdf_path" in report_result.data:
-            pdf_path = report_result.data["pdf_path"]
-            result["pdf_path"] = pdf_path
+        Returns:
+            list[PipelineResult]: One result per job, errors in-place
+
+        Example:
+            >>> results = await orchestrator.run_many([
+            ...     {"mode": "overview", "topic": "Rust"},
+            ...     {"mode": "compare", "item_a": "Rust", "item_b": "Go"},
+            ... ])
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(job: dict) -> dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.arun(**job)
+                except Exception as e:
+                    return PipelineResult(
+                        error=f"Pipeline failed: {str(e)}",
+                        stage="pipeline"
+                    )
+
+        return list(await asyncio.gather(*(_bounded(job) for job in jobs)))
 
-            # Extract PDF filename and add download URL
+    def _assemble_result(
+        self,
+        mode: str,
+        topic: Optional[str],
+        item_a: Optional[str],
+        item_b: Optional[str],
+        depth: str,
+        steps: list,
+        report_data: dict
+    ) -> PipelineResult:
+        """
+        Build the final pipeline response dict from the report output.
+
+        Shared by run() and arun() so the success shape stays identical
+        between the sync and async paths.
+
+        Args:
+            mode: Research mode the pipeline ran in
+            topic: Main research topic (overview mode)
+            item_a: First comparison item (compare mode)
+            item_b: Second comparison item (compare mode)
+            depth: Analysis depth used
+            steps: Plan steps from the PlannerAgent
+            report_data: The ReportAgent result data
+
+        Returns:
+            PipelineResult: The "completed" result with paths and URLs
+        """
+        report_path = report_data["report_path"]
+        report_filename = os.path.basename(report_path)
+
+        # PDF path and download URL, when a PDF was generated
+        pdf_path = report_data.get("pdf_path")
+        pdf_url = None
+        if pdf_path is not None:
             pdf_filename = os.path.basename(pdf_path)
-            result["pdf_url"] = f"http://localhost:8000/reports/pdf/{pdf_filename}"
+            pdf_url = f"http://localhost:8000/reports/pdf/{pdf_filename}"
 
-        return result
+        return PipelineResult(
+            status="completed",
+            mode=mode,
+            topic=topic,
+            item_a=item_a,
+            item_b=item_b,
+            depth=depth,
+            steps=steps,
+            report_path=report_path,
+            view_url=f"http://localhost:8000/reports/view/{report_filename}",
+            report_html=report_data.get("report_html"),
+            pdf_path=pdf_path,
+            pdf_url=pdf_url
+        )
@@ -0,0 +1,64 @@
+"""
+Async rate limiting for outbound API calls.
+
+Upstream LLM providers enforce queries-per-minute quotas; exceeding
+them turns into 429 storms that retries only amplify. AsyncRateLimiter
+spaces calls to a target QPM so high fan-out paths (arun_many, batch
+analysis, the compare-mode gather) self-throttle at the source instead
+of burning retry budget.
+
+The limiter deliberately avoids asyncio synchronization primitives:
+the pipeline's sync entry points create a fresh event loop per call
+(asyncio.run), and an asyncio.Lock bound to one loop cannot be reused
+from another. Bookkeeping is guarded by a plain threading.Lock (held
+only for arithmetic, never across an await), so one limiter instance
+can be shared across loops and threads alike.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Spaces async calls to a maximum sustained rate.
+
+    Each ``async with limiter:`` reserves the next available send slot
+    and sleeps until it arrives; slots are max_rate per time_period
+    apart, so the long-run rate never exceeds the quota regardless of
+    how many tasks, loops, or threads share the limiter.
+
+    Attributes:
+        interval: Minimum spacing between calls, in seconds
+
+    Example:
+        >>> limiter = AsyncRateLimiter(max_rate=500, time_period=60.0)
+        >>> async with limiter:
+        ...     response = await client.generate_async(prompt)
+    """
+
+    def __init__(self, max_rate: int, time_period: float = 60.0) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            max_rate: Maximum calls allowed per time_period
+            time_period: Window length in seconds (default: one minute)
+        """
+        self.interval = time_period / max(max_rate, 1)
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        with self._lock:
+            now = time.monotonic()
+            slot = self._next_slot if self._next_slot > now else now
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False